@@ -43,6 +43,16 @@ a = 'a\u0300 propos'
 print(list(a))
 print(a)
 
+# '\u0300' is a combining grave accent, so 'a\u0300' is two code points that display as one character.
+# unicodedata.normalize('NFC', ...) composes such pairs into a single code point.
+# A translation table built with str.maketrans does something different:
+# it maps one code point at a time, so it can drop or replace a known set of code points
+# (here, deleting the accent) but can't compose them, and it's no substitute for normalization.
+import unicodedata
+print(list(unicodedata.normalize('NFC', a)))
+strip_accents = str.maketrans({'\u0300': None})
+assert a.translate(strip_accents) == 'a propos'
+
 # Importantly, str instances do not have an associated binary encoding,
 # and bytes instances do not have an associated text encoding.
 # Byte contains sequences of 8-bit values, and str contains sequences of Unicode code points.
@@ -74,6 +84,10 @@ def to_bytes(bytes_or_str):
 print(repr(to_bytes(b'foo')))
 print(repr(to_bytes('bar')))
 
+# There is no need to drop down to C for these helpers:
+# CPython recognizes the 'utf-8' codec name and calls its built-in UTF-8 decoder/encoder directly,
+# without going through the general codec registry lookup.
+
 #  When a file is in text mode,
 #  write operations expect str instances containing Unicode data
 #  instead of bytes instances containing binary data.
@@ -96,6 +110,25 @@ with open('data.bin', 'rb') as f:
 
 assert data == b'\xf1\xf2\xf3\xf4\xf5'
 
+# Binary mode still wraps the file in a buffered writer/reader object.
+# For a single small write or read, the os module can work on the raw file descriptor directly,
+# which only ever deals in bytes.
+import os
+
+fd = os.open('data.bin', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+try:
+    os.write(fd, b'\xf1\xf2\xf3\xf4\xf5')
+finally:
+    os.close(fd)
+
+fd = os.open('data.bin', os.O_RDONLY)
+try:
+    data = os.read(fd, 8192)
+finally:
+    os.close(fd)
+
+assert data == b'\xf1\xf2\xf3\xf4\xf5'
+
 # Alternatively, I can explicitly specify the encoding parameter to the open function
 # to make sure that I’m not surprised by any platform-specific behavior.
 with open('data.bin', 'r', encoding='cp1252') as f:
@@ -140,6 +173,12 @@ b = 'my string'
 formatted = format(b, '^20s')  # ^ for centering
 print('*', formatted, '*')
 
+# The spec is handed to the value's __format__ method, which interprets it on every call,
+# so wrapping a constant spec in a helper function doesn't save any work in Python.
+# An f-string with the same spec after the colon is the equivalent (and shorter) spelling.
+assert format(a, ',.2f') == f'{a:,.2f}'
+assert format(b, '^20s') == f'{b:^20s}'
+
 # Instead of using C-style format specifiers like %d,
 # you can specify placeholders with {}.
 key = 'my_var'
@@ -261,6 +300,8 @@ print(f'My number is {number:.{places}f}')
 # The combination of expressiveness, terseness, and clarity provided by f-strings makes them the best built-in option
 # for Python programmers. Any time you find yourself needing to format values into strings,
 # choose f-strings over the alternatives.
+# They are usually the fastest option too: % and str.format parse their template string on every call,
+# whereas an f-string is split into its pieces once, when the code is compiled to bytecode.
 
 # Item 5: Write Helper Functions Instead of Complex Expressions
 # Python’s pithy syntax makes it easy to write single-line expressions that implement a lot of logic.
@@ -310,8 +351,9 @@ else:
 
 # If you need to reuse this logic repeatedly—even just two or three times,
 # as in this example—then writing a helper function is the way to go
+# (The ('',) default is a constant tuple, so unlike [''] it isn't rebuilt on every call.)
 def get_first_int(values, key, default=0):
-    found = values.get(key, [''])
+    found = values.get(key, ('',))
     if found[0]:
         return int(found[0])
     return default
@@ -319,6 +361,47 @@ def get_first_int(values, key, default=0):
 
 green = get_first_int(my_values, 'green')
 
+
+# parse_qs builds a dictionary of lists for every parameter in the query string.
+# If I only ever need one key, a helper can scan the raw string and stop at the first match.
+# (Unlike parse_qs, this doesn't decode %-escapes or '+', so it's only for plain values.)
+def get_first_int_from_query(query, key, default=0):
+    for pair in query.split('&'):
+        name, _, value = pair.partition('=')
+        if name == key:
+            return int(value) if value else default
+    return default
+
+
+assert get_first_int_from_query('red=5&blue=0&green=', 'red') == 5
+assert get_first_int_from_query('red=5&blue=0&green=', 'green') == 0
+assert get_first_int_from_query('red=5&blue=0&green=', 'opacity') == 0
+
+# When I need several keys from the same string,
+# a compiled regular expression can pull out every integer parameter in one scan.
+# If a key repeats, the first value wins, the same as get_first_int.
+# Parameters whose values aren't all digits are skipped, so signed values like '-3'
+# and %-escaped ones like '%31' are dropped even though parse_qs plus int() would accept them
+# (like get_first_int_from_query, this doesn't unquote).
+import re
+
+query_int_pattern = re.compile(r'(?:^|&)([^&=]+)=(\d*)(?=&|$)')
+
+
+def parse_query_ints(query):
+    result = {}
+    for m in query_int_pattern.finditer(query):
+        result.setdefault(m.group(1), int(m.group(2)) if m.group(2) else 0)
+    return result
+
+
+query_ints = parse_query_ints('red=5&blue=0&green=')
+red = query_ints.get('red', 0)
+green = query_ints.get('green', 0)
+opacity = query_ints.get('opacity', 0)
+assert (red, green, opacity) == (5, 0, 0)
+assert parse_query_ints('red=5&red=7')['red'] == get_first_int(parse_qs('red=5&red=7'), 'red') == 5
+
 # What you gain in readability always outweighs what brevity may have afforded you.
 # Follow the DRY principle: Don’t repeat yourself.
 
@@ -332,6 +415,11 @@ snack_calories = {
 items = tuple(snack_calories.items())
 print(items)
 
+# (Building the tuple copies every pair. If I only need to go through the pairs once,
+# the items view can be iterated directly without materializing anything.)
+for snack, calories in snack_calories.items():
+    print(snack, calories)
+
 # The values in tuples can be accessed through numerical indexes
 item = ('Peanut butter', 'Jelly')
 first = item[0]
@@ -367,6 +455,12 @@ print(f'Favorite {type1} is {name1} with {cals1} calories')
 print(f'Favorite {type2} is {name2} with {cals2} calories')
 print(f'Favorite {type3} is {name3} with {cals3} calories')
 
+# Unpacking a fixed number of rows like this doesn't scale.
+# To find the row with the most calories, make one pass with max and unpack only the winner.
+top_type, (top_name, top_cals) = max(favorite_snacks.items(),
+                                     key=lambda item: item[1][1])
+print(f'Most filling is the {top_type} {top_name} with {top_cals} calories')
+
 
 # Unpacking can even be used to swap values in place
 # without the need to create temporary variables
@@ -397,6 +491,13 @@ names = ['pretzels', 'carrots', 'arugula', 'bacon']
 bubble_sort(names)
 print(names)
 
+# bubble_sort is only here to show off the swap; its nested loops are O(n^2) in Python bytecode.
+# When you actually need sorted data, use the built-in sort method,
+# which runs Timsort in C and does O(n log n) comparisons.
+names = ['pretzels', 'carrots', 'arugula', 'bacon']
+names.sort()
+print(names)
+
 # Another valuable application of unpacking
 # is in the target list of for loops and similar constructs,
 # such as comprehensions and generator expressions
@@ -413,6 +514,18 @@ for i in range(32):
         random_bits |= 1 << i  # 1 << i has higher priority
 print(bin(random_bits))
 
+# (The loop above is just to demonstrate range.
+# To actually get 32 random bits, make one call instead of 32 randint calls.)
+from random import getrandbits
+random_bits = getrandbits(32)
+print(bin(random_bits))
+
+# If I need many such masks, I can draw all of the bytes at once (Python 3.9+)
+# and view them as unsigned 32-bit integers ('I' is 4 bytes on all common platforms).
+from random import randbytes
+masks = memoryview(randbytes(4 * 1024)).cast('I')
+print(len(masks), bin(masks[0]))
+
 # enumerate wraps any iterator with a lazy generator
 # The second parameter specifies the number
 # from which to begin counting (zero is the default).
@@ -431,11 +544,19 @@ print(counts)
 # Python provides the zip built-in function.
 # zip wraps two or more iterators with a lazy generator.
 # The zip generator yields tuples containing the next value from each iterator.
+longest_name = None
+max_count = 0
 for name, count in zip(names, counts):
     if count > max_count:
         longest_name = name
         max_count = count
 
+# When all you need is the longest name, the max built-in does the same search in one call
+# and doesn't need the counts list at all.
+longest_name = max(names, key=len)
+max_count = len(longest_name)
+assert longest_name == 'Cecilia'
+
 # zip consumes the iterators it wraps one item at a time, which means it can be used with infinitely long inputs
 # without risk of a program using too much memory and crashing.
 # It keeps yielding tuples until any one of the wrapped iter- ators is exhausted.
@@ -444,11 +565,19 @@ for name, count in zip(names, counts):
 # consider using the zip_longest function from the itertools built-in module instead
 # zip_longest replaces missing values—the length of the string 'Rosalind' in this case
 # -with whatever fillvalue is passed to it, which defaults to None.
+# Like zip, it's implemented in C, and when the loop unpacks each tuple right away
+# it reuses the same result tuple instead of allocating a new one per step.
 import itertools
 names.append('Rosalind')
 for name, count in itertools.zip_longest(names, counts):
     print(f'{name}: {count}')
 
+# With many rows, build the lines first and write them with a single print call
+# instead of paying for one print (and one write) per line.
+report = '\n'.join(f'{name}: {count}'
+                   for name, count in itertools.zip_longest(names, counts))
+print(report)
+
 # Item 9: Avoid else Blocks After for and while Loops
 # You can put an else block immediately after a loop’s repeated interior block
 for i in range(3):
@@ -518,6 +647,19 @@ def coprime_alternate(a, b):
 assert coprime_alternate(4, 9)
 assert not coprime_alternate(3, 6)
 
+# Both helpers do trial division up to min(a, b), which is O(n).
+# Outside of this example, ask the math built-in module instead:
+# gcd uses Euclid's algorithm in C, which takes O(log n) steps.
+import math
+
+
+def coprime_gcd(a, b):
+    return math.gcd(a, b) == 1
+
+
+assert coprime_gcd(4, 9)
+assert not coprime_gcd(3, 6)
+
 
 # However, the expressivity you gain from the else block doesn’t outweigh the burden you put on people
 # (including yourself) who want to understand your code in the future.
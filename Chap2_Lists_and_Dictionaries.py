@@ -72,6 +72,15 @@ print(evens)
 # using one assignment for striding and another for slicing.
 # If your program can’t afford the time or memory required for two steps,
 # consider using the itertools built-in module’s islice method.
+# islice also works on iterators that can't be sliced at all, and only pulls the items it needs.
+# For the last N items of an iterator, a deque with maxlen keeps just a window of N items in memory.
+import itertools
+from collections import deque
+
+numbers = iter(range(100))
+first_twenty_items = list(itertools.islice(numbers, 20))
+last_twenty_items = list(deque(numbers, maxlen=20))
+print(first_twenty_items[-1], last_twenty_items[0])
 
 # Item 13: Prefer Catch-All Unpacking Over Slicing
 # Python also supports catch-all unpacking through a starred expression.
@@ -136,6 +145,12 @@ print('Row count: ', len(rows))
 
 # You should only use catch-all unpacking on iterators
 # when you have good reason to believe that the result data will all fit in memory
+# Otherwise, take the header with next and keep streaming the rest of the iterator
+it = generate_csv()
+header = next(it)
+row_count = sum(1 for _ in it)
+print('CSV Header:', header)
+print('Row count: ', row_count)
 
 # Item 14: Sort by Complex Criteria Using the key Parameter
 # The list built-in type provides a sort method for ordering the items in a list instance
@@ -154,6 +169,8 @@ print(numbers)
 # The return value of the key function should be a comparable value (i.e., with a natural ordering)
 # to use in place of an item for sorting purposes.
 class Tool:
+    __slots__ = ('name', 'weight')  # No per-instance __dict__, so smaller objects and faster attribute access
+
     def __init__(self, name, weight):
         self.name = name
         self.weight = weight
@@ -183,6 +200,10 @@ print('Case sensitive:  ', places)
 places.sort(key=lambda x: x.lower())
 print('Case insensitive:', places)
 
+# A method can be passed as the key directly, which skips the extra lambda call for each item
+places.sort(key=str.lower)
+print('Case insensitive:', places)
+
 # Sometimes you may need to use multiple criteria for sorting.
 # The simplest solution in Python is to use the tuple type.
 # Tuples implement these special method comparators
@@ -198,6 +219,13 @@ power_tools = [
 power_tools.sort(key=lambda x: (x.weight, x.name))
 print(power_tools)
 
+# The operator built-in module's attrgetter builds the same keys in C, without calling a lambda per item.
+# Given several attribute names, it returns a tuple of them.
+from operator import attrgetter
+
+power_tools.sort(key=attrgetter('weight', 'name'))
+print(power_tools)
+
 # One limitation of having the key function return a tuple is
 # that the direction of sorting for all criteria must be the same
 # For numerical values it’s possible to mix sorting directions
@@ -214,6 +242,11 @@ power_tools.sort(key=lambda x: x.name)  # Name ascending
 power_tools.sort(key=lambda x: x.weight, reverse=True)  # Weight descending
 print(power_tools)
 
+# Each extra pass is another full sort, so only fall back to multiple passes
+# when a criterion can't be negated (like strings in descending order).
+# Here the weight is numeric, so the single tuple key from above gives the same order in one sort.
+assert power_tools == sorted(power_tools, key=lambda x: (-x.weight, x.name))
+
 # Item 15: Be Cautious When Relying on dict Insertion Ordering
 # In Python 3.5 and before, iterating over a dict would return keys in arbitrary order.
 # This happened because the dictionary type previously implemented its hash table algorithm
@@ -274,11 +307,14 @@ votes = {
 # I define a function to process this voting data
 # and save the rank of each animal name into a provided empty dictionary.
 # In this case, the dictionary could be the data model that powers a UI element
+# (sorted builds and sorts the list of keys in one call, with votes.get run once per key.
+# That is the decorate-sort-undecorate pattern done for you in C; sorting hand-built (-count, name)
+# tuples wouldn't be faster and would break ties by name instead of keeping insertion order.
+# update then takes all the (name, rank) pairs in one call; on a plain dict the inserts run in C,
+# while a MutableMapping such as SortedDict below still calls __setitem__ once per pair.)
 def populate_ranks(votes, ranks):
-    names = list(votes.keys())
-    names.sort(key=votes.get, reverse=True)
-    for i, name in enumerate(names, 1):
-        ranks[name] = i
+    names = sorted(votes, key=votes.get, reverse=True)
+    ranks.update(zip(names, range(1, len(names) + 1)))
 
 
 def get_winner(ranks):
@@ -291,28 +327,47 @@ print(ranks)
 winner = get_winner(ranks)
 print(winner)
 
+# If only the top few animals are needed, there's no need to rank all of them.
+# heapq.nlargest keeps a heap of just k items while scanning the votes once.
+import heapq
+
+
+def get_winners(votes, k=1):
+    return heapq.nlargest(k, votes, key=votes.get)
+
+
+assert get_winners(votes) == ['otter']
+print(get_winners(votes, 2))
+
 #  The UI element that shows the results should be in alphabetical order instead of rank order.
+# (Subclassing dict directly would be faster for lookups, but dict's C methods such as keys, items,
+# and repr ignore an overridden __iter__, so the sorted order would only show up in some places.
+# It would also hide the dict vs. MutableMapping mismatch that the type annotations below catch.)
+# The keys are kept in order as they're inserted (using the bisect built-in module),
+# so iterating doesn't need to sort anything.
 from collections.abc import MutableMapping
+import bisect
 
 
 class SortedDict(MutableMapping):
     def __init__(self):
         self.data = {}
+        self.sorted_keys = []
 
     def __getitem__(self, key):
         return self.data[key]
 
     def __setitem__(self, key, value):
+        if key not in self.data:
+            bisect.insort(self.sorted_keys, key)
         self.data[key] = value
 
     def __delitem__(self, key):
         del self.data[key]
+        self.sorted_keys.pop(bisect.bisect_left(self.sorted_keys, key))
 
     def __iter__(self):
-        keys = list(self.data.keys())
-        keys.sort()
-        for key in keys:
-            yield key
+        return iter(self.sorted_keys[:])  # Copy, so the mapping can change while it's iterated
 
     def __len__(self):
         return len(self.data)
@@ -328,6 +383,14 @@ print(sorted_ranks.data)
 winner = get_winner(sorted_ranks)
 print(winner)
 
+# Iterating walks a copy of the sorted keys, so deleting during the loop still visits every key.
+letters = SortedDict()
+for letter in 'abcdef':
+    letters[letter] = ord(letter)
+for letter in letters:
+    del letters[letter]
+assert len(letters) == 0
+
 # when using type annotations to enforce that the value passed to get_winner is a dict instance
 # and not a MutableMapping with dictionary-like behavior
 # This correctly detects the mismatch between the dict and MutableMapping types
@@ -338,10 +401,8 @@ from typing import Dict, MutableMapping
 
 def populate_ranks(votes: Dict[str, int],
                    ranks: Dict[str, int]) -> None:
-    names = list(votes.keys())
-    names.sort(key=votes.get, reverse=True)
-    for i, name in enumerate(names, 1):
-        ranks[name] = i
+    names = sorted(votes, key=votes.get, reverse=True)
+    ranks.update(zip(names, range(1, len(names) + 1)))
 
 
 def get_winner(ranks: Dict[str, int]) -> str:
@@ -398,6 +459,14 @@ counters[key] = count + 1
 count = counters.get(key, 0)
 counters[key] = count + 1
 
+# When counting many keys at once, collections.Counter does the get-and-increment
+# for a whole iterable inside its update method (a C loop), with one call from Python.
+from collections import Counter
+
+bread_counts = Counter(counters)
+bread_counts.update(['wheat', 'rye', 'wheat', 'sourdough'])
+print(bread_counts)
+
 # Example: if the values of the dictionary are a more complex type, like a list
 votes = {
     'baguette': ['Bob', 'Alice'],
@@ -452,6 +521,14 @@ if (japan := visits.get('Japan')) is None:  # Long
 japan.add('Kyoto')
 print(visits)
 
+# When adding many cities in a loop, the bound setdefault method can be looked up once
+# and stored in a local variable instead of being resolved on every iteration.
+trips = [('France', 'Paris'), ('Japan', 'Osaka'), ('Italy', 'Rome')]
+setdefault = visits.setdefault
+for country, city in trips:
+    setdefault(country, set()).add(city)
+print(visits)
+
 
 # When you do control creation of the dictionary being accessed
 # This is generally the case when you’re using a dictionary instance
@@ -482,6 +559,9 @@ print(visits.data)
 # by automatically storing a default value when a key does not exist.
 # All you have to do is provide a function
 # that will return the default value to use each time a key is missing
+from collections import defaultdict
+
+
 class Visits:
     def __init__(self):
         self.data = defaultdict(set)
@@ -489,12 +569,20 @@ class Visits:
     def add(self, country, city):
         self.data[country].add(city)
 
+    def add_many(self, country, cities):
+        self.data[country].update(cities)
+
 
 visits = Visits()
 visits.add('England', 'Bath')
 visits.add('England', 'London')
+visits.add_many('Scotland', ['Edinburgh', 'Glasgow'])  # One call for a whole batch
 print(visits.data)
 
+# defaultdict calls the set type directly from C when a key is missing, so no Python code runs on a miss.
+# A dict subclass with a __missing__ method (see Item 18) would add a Python function call to every miss;
+# it's only worth it when the default value has to depend on the key.
+
 # If you’re creating a dictionary to manage an arbitrary set of potential keys,
 # then you should prefer using a defaultdict instance
 # from the collections built-in module if it suits your problem.
@@ -596,3 +684,8 @@ pictures = Pictures()
 handle = pictures[path]
 handle.seek(0)
 image_data = handle.read()
+
+# The Pictures dictionary already is the cache: once a path is inserted,
+# later lookups are plain dict accesses that never reach __missing__.
+# Wrapping open_picture in functools.lru_cache as well would only add a second cache
+# holding a duplicate reference to every handle.
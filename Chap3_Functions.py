@@ -145,6 +145,8 @@ def sort_priority3(numbers, group):
 # When your usage of nonlocal starts getting complicated,
 # it’s better to wrap your state in a helper class.
 class Sorter:
+    __slots__ = ('group', 'found')  # Fixed attributes, so no per-instance __dict__
+
     def __init__(self, group):
         self.group = group
         self.found = False
@@ -161,6 +163,18 @@ numbers.sort(key=sorter)
 assert sorter.found is True
 
 
+# In this particular case, the flag only answers "did any number belong to the group?",
+# so it doesn't have to be tracked inside the key function at all.
+# The set's isdisjoint method computes it in one call, and the key stays free of side effects.
+def sort_priority4(numbers, group):
+    numbers.sort(key=lambda x: (x not in group, x))
+    return not group.isdisjoint(numbers)
+
+
+assert sort_priority4(numbers, group) is True
+print(numbers)
+
+
 # Item 22: Reduce Visual Noise with Variable Positional Arguments
 # Accepting a variable number of positional arguments
 # can make a function call clearer and reduce visual noise.
@@ -170,7 +184,7 @@ def log(message, values):
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{message}: {values_str}')
 
 
@@ -184,7 +198,7 @@ def log(message, *values):  # The only difference
     if not values:
         print(message)
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{message}: {values_str}')
 
 
@@ -233,7 +247,7 @@ def log(sequence, message, *values):
     if not values:
         print(f'{sequence} - {message}')
     else:
-        values_str = ', '.join(str(x) for x in values)
+        values_str = ', '.join(map(str, values))
         print(f'{sequence} - {message}: {values_str}')
 
 
@@ -597,3 +611,20 @@ print(pickle.dumps(fibonacci))
 # (e.g., __name__, __module__, __annotations__) that must be preserved
 # to maintain the interface of functions in the language.
 # Using wraps ensures that you’ll always get the correct behavior.
+
+# The recursive fibonacci above recomputes the same values over and over, which takes exponential time.
+# functools.lru_cache is itself a decorator that remembers previous results,
+# so each value is computed only once. It also copies the wrapped function's metadata like wraps does.
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def fibonacci(n):
+    """Return the n-th Fibonacci number"""
+    if n in (0, 1):
+        return n
+    return (fibonacci(n - 2) + fibonacci(n - 1))
+
+
+assert fibonacci(100) == 354224848179261915075
+print(fibonacci.__name__, fibonacci.__doc__)
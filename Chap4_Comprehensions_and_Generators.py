@@ -25,6 +25,9 @@ a = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 squares = [x**2 for x in a]  # List comprehension
 print(squares)
 
+# For small ints, x * x is a little cheaper than x**2 because it skips the generic pow path.
+assert squares == [x * x for x in a]
+
 # List comprehensions let you easily filter items from the input list,
 # removing corresponding outputs from the result.
 even_squares = [x**2 for x in a if x % 2 == 0]
@@ -113,6 +116,7 @@ for name in order:
 print(result)
 
 # implement this looping logic more succinctly using a dictionary comprehension
+# This is the slow baseline: get_batches and stock.get run twice for every name that passes the filter.
 found = {name: get_batches(stock.get(name, 0), 8)
          for name in order
          if get_batches(stock.get(name, 0), 8)}
@@ -120,8 +124,11 @@ print(found)
 
 # to use the walrus operator (:=) to form an assignment expression
 # as part of the comprehension
+# Each name now costs one lookup and one call, and the two expressions can't drift apart.
 found = {name: batches for name in order
          if (batches := get_batches(stock.get(name, 0), 8))}
+print(found)
+assert found == result
 
 # It’s valid syntax to define an assignment expression in the value expression for a comprehension.
 # But if you try to reference the variable it defines in other parts of the comprehension,
@@ -192,6 +199,20 @@ result = list(index_words_iter(address))
 print(result[:10])
 
 
+# The same generator can let str.find skip whole runs of non-space characters in C
+# instead of comparing every letter in Python.
+def index_words_find(text):
+    if text:
+        yield 0
+    index = text.find(' ')
+    while index != -1:
+        yield index + 1
+        index = text.find(' ', index + 1)
+
+
+assert list(index_words_find(address)) == result
+
+
 # For example, here I define a generator that streams input from a file one line at a time
 # and yields outputs one word at a time.
 def index_file(handle):
@@ -214,6 +235,27 @@ with open('address.txt', 'r') as f:
     results = itertools.islice(it, 0, 10)
     print(list(results))
 
+
+# index_file still steps through every letter in Python.
+# A line-at-a-time version of index_words_find keeps the same working memory
+# and lets str.find jump between spaces.
+def index_file_find(handle):
+    offset = 0
+    for line in handle:
+        if line:
+            yield offset
+        index = line.find(' ')
+        while index != -1:
+            yield offset + index + 1
+            index = line.find(' ', index + 1)
+        offset += len(line)
+
+
+with open('address.txt', 'r') as f:
+    it = index_file_find(f)
+    results = itertools.islice(it, 0, 10)
+    print(list(results))
+
 # The only gotcha with defining generators like this is
 # that the callers must be aware that the iterators returned are stateful and can’t be reused
 
@@ -778,6 +820,9 @@ print(list(it))
 it = itertools.cycle([1, 2])
 result = [next(it) for _ in range (10)]
 print(result)
+# islice takes the first N items without a Python-level next call per item,
+# and when N is known up front, list repetition builds the same list in one step.
+assert result == list(itertools.islice(itertools.cycle([1, 2]), 10)) == [1, 2] * 5
 
 # Use tee to split a single iterator into the number of parallel iterators specified by the second parameter
 # The memory usage of this function will grow
@@ -786,6 +831,14 @@ it1, it2, it3 = itertools.tee(['first', 'second'], 3)
 print(list(it1))
 print(list(it2))
 print(list(it3))
+# When each copy is drained completely before the next one starts, as here,
+# tee ends up buffering every item anyway.
+# Materializing the items once in a list and taking a fresh iter() per consumer
+# does the same job with less bookkeeping.
+source = iter(['first', 'second'])
+items = list(source)  # Materialize once
+it1, it2, it3 = (iter(items) for _ in range(3))
+assert list(it1) == list(it2) == list(it3) == ['first', 'second']
 
 # zip_longest returns a placeholder value when an iterator is exhausted,
 # which may happen if iterators have different lengths
@@ -844,13 +897,32 @@ def sum_modulo_20(first, second):
 modulo_reduce = itertools.accumulate(values, sum_modulo_20)
 print('Modulo:', list(modulo_reduce))
 
+# Since (a + b) % 20 == (a % 20 + b) % 20, the same running values come from
+# the default C-level summing accumulate with one % per item afterwards,
+# which skips the Python call to sum_modulo_20 for every step.
+# accumulate passes the first item through untouched, so this only holds while 0 <= values[0] < 20.
+assert list(itertools.accumulate(values, sum_modulo_20)) == \
+       [total % 20 for total in itertools.accumulate(values)]
+
+# accumulate is lazy, so a downstream reduction can consume it directly
+# and the running values never get stored in an intermediate list.
+assert max(itertools.accumulate(values, sum_modulo_20)) == 16
+
 # This is essentially the same as the reduce function from the functools built-in module,
 # but with outputs yielded one step at a time.
 # By default, it sums the inputs if no binary function is specified.
 
 from functools import reduce
+from operator import add
 
 assert reduce(lambda x, y: x+y, [1, 2, 3, 4, 5])==15
+# operator.add is a C function, so it avoids a Python frame per step.
+# Prefer the operator module over small lambdas for reduce, map, and accumulate.
+assert reduce(add, [1, 2, 3, 4, 5]) == 15
+
+# For plain addition, the sum built-in runs the same fold in C without a lambda call per item.
+# Use math.fsum for floats when the rounding error of a running sum matters.
+assert sum([1, 2, 3, 4, 5]) == 15
 
 # product returns the Cartesian product of items from one or more iterators,
 # which is a nice alternative to using deeply nested list comprehensions